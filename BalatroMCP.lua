@@ -266,6 +266,7 @@ require('love.filesystem')
 local state_channel = love.thread.getChannel('mcp_state_updates')
 local action_channel = love.thread.getChannel('mcp_action_requests') 
 local result_channel = love.thread.getChannel('mcp_action_results')
+local exit_channel = love.thread.getChannel('mcp_exit')
 
 -- Simple state tracking
 local last_processed_sequence = 0
@@ -275,7 +276,7 @@ print("BalatroMCP Worker: Thread started")
 
 while true do
     -- Check for exit signal
-    local exit_signal = love.thread.getChannel('mcp_exit'):pop()
+    local exit_signal = exit_channel:pop()
     if exit_signal then
         print("BalatroMCP Worker: Exit signal received")
         break
@@ -321,10 +322,11 @@ while true do
         end
     end
     
-    -- Sleep to prevent busy waiting (simple busy wait since love.timer not available in thread)
-    local start_time = os.clock()
-    while os.clock() - start_time < polling_interval do
-        -- Simple busy wait
+    -- Block on the exit channel until the next poll instead of spinning the CPU;
+    -- an exit signal wakes the thread immediately
+    if exit_channel:demand(polling_interval) then
+        print("BalatroMCP Worker: Exit signal received")
+        break
     end
 end
 
@@ -545,13 +547,9 @@ function BalatroMCP:stop()
         print("BalatroMCP: Sending exit signal to worker thread")
         self.exit_channel:push(true)
         
-        -- Wait a bit for thread to exit gracefully
+        -- The worker blocks on the exit channel between polls, so it exits promptly
         if self.mcp_worker then
-            -- Give thread time to exit (simple wait)
-            local wait_start = os.clock()
-            while os.clock() - wait_start < 0.1 do
-                -- Simple wait
-            end
+            self.mcp_worker:wait()
             self.mcp_worker = nil
         end
         
@@ -7,6 +7,31 @@ local BlindValidator = assert(SMODS.load_file("action_executor/validators/blind_
 local RerollValidator = assert(SMODS.load_file("action_executor/validators/reroll_validator.lua"))()
 local StateExtractorUtils = assert(SMODS.load_file("state_extractor/utils/state_extractor_utils.lua"))()
 
+-- Execute method for each action type, looked up by name so dispatch is a single
+-- table access rather than a walk through every supported action type
+local ACTION_HANDLERS = {
+    play_hand = "execute_play_hand",
+    discard_cards = "execute_discard_cards",
+    go_to_shop = "execute_go_to_shop",
+    buy_item = "execute_buy_item",
+    sell_joker = "execute_sell_joker",
+    sell_consumable = "execute_sell_consumable",
+    reorder_jokers = "execute_reorder_jokers",
+    select_blind = "execute_select_blind",
+    select_pack_offer = "execute_select_pack_offer",
+    use_pack_tarot = "execute_use_pack_tarot",
+    reroll_boss = "execute_reroll_boss",
+    reroll_shop = "execute_reroll_shop",
+    sort_hand_by_rank = "execute_sort_hand_by_rank",
+    sort_hand_by_suit = "execute_sort_hand_by_suit",
+    use_consumable = "execute_use_consumable",
+    move_playing_card = "execute_move_playing_card",
+    skip_blind = "execute_skip_blind",
+    go_next = "execute_go_next",
+    diagnose_blind_progression = "execute_diagnose_blind_progression",
+    diagnose_blind_activation = "execute_diagnose_blind_activation"
+}
+
 local ActionExecutor = {}
 ActionExecutor.__index = ActionExecutor
 
@@ -178,46 +203,9 @@ function ActionExecutor:execute_action(action_data)
     local error_message = nil
     local new_state = nil
     
-    if action_type == "play_hand" then
-        success, error_message = self:execute_play_hand(action_data)
-    elseif action_type == "discard_cards" then
-        success, error_message = self:execute_discard_cards(action_data)
-    elseif action_type == "go_to_shop" then
-        success, error_message = self:execute_go_to_shop(action_data)
-    elseif action_type == "buy_item" then
-        success, error_message = self:execute_buy_item(action_data)
-    elseif action_type == "sell_joker" then
-        success, error_message = self:execute_sell_joker(action_data)
-    elseif action_type == "sell_consumable" then
-        success, error_message = self:execute_sell_consumable(action_data)
-    elseif action_type == "reorder_jokers" then
-        success, error_message = self:execute_reorder_jokers(action_data)
-    elseif action_type == "select_blind" then
-        success, error_message = self:execute_select_blind(action_data)
-    elseif action_type == "select_pack_offer" then
-        success, error_message = self:execute_select_pack_offer(action_data)
-    elseif action_type == "use_pack_tarot" then
-        success, error_message = self:execute_use_pack_tarot(action_data)
-    elseif action_type == "reroll_boss" then
-        success, error_message = self:execute_reroll_boss(action_data)
-    elseif action_type == "reroll_shop" then
-        success, error_message = self:execute_reroll_shop(action_data)
-    elseif action_type == "sort_hand_by_rank" then
-        success, error_message = self:execute_sort_hand_by_rank(action_data)
-    elseif action_type == "sort_hand_by_suit" then
-        success, error_message = self:execute_sort_hand_by_suit(action_data)
-    elseif action_type == "use_consumable" then
-        success, error_message = self:execute_use_consumable(action_data)
-    elseif action_type == "move_playing_card" then
-        success, error_message = self:execute_move_playing_card(action_data)
-    elseif action_type == "skip_blind" then
-        success, error_message = self:execute_skip_blind(action_data)
-    elseif action_type == "go_next" then
-        success, error_message = self:execute_go_next(action_data)
-    elseif action_type == "diagnose_blind_progression" then
-        success, error_message = self:execute_diagnose_blind_progression(action_data)
-    elseif action_type == "diagnose_blind_activation" then
-        success, error_message = self:execute_diagnose_blind_activation(action_data)
+    local handler_name = ACTION_HANDLERS[action_type]
+    if handler_name then
+        success, error_message = self[handler_name](self, action_data)
     else
         success = false
         error_message = "Unknown action type: " .. action_type
@@ -1,6 +1,14 @@
 -- Debug logging module for Balatro MCP integration testing
 -- Provides comprehensive logging to diagnose integration issues
 
+-- Shared per-second timestamp formatting; plain require covers test environments without SMODS
+local TimestampCache
+if SMODS and SMODS.load_file then
+    TimestampCache = assert(SMODS.load_file("timestamp_cache.lua"))()
+else
+    TimestampCache = require("timestamp_cache")
+end
+
 local DebugLogger = {}
 DebugLogger.__index = DebugLogger
 
@@ -20,6 +28,7 @@ function DebugLogger.new(log_file_path, base_path)
     end
     
     self.log_level = "DEBUG" -- DEBUG, INFO, WARN, ERROR
+    self.timestamp_cache = TimestampCache.new("%Y-%m-%d %H:%M:%S")
     self.session_id = "session_" .. tostring(os.time())
     
     -- Ensure log directory exists (only for subdirectories)
@@ -33,7 +42,7 @@ end
 
 function DebugLogger:log(level, message, component)
     component = component or "MAIN"
-    local timestamp = os.date("%Y-%m-%d %H:%M:%S")
+    local timestamp = self.timestamp_cache:get()
     local log_entry = string.format("[%s] [%s] [%s] %s", timestamp, level, component, message)
     
     -- Always print to console
@@ -42,11 +51,7 @@ function DebugLogger:log(level, message, component)
     -- Write to file if possible
     if love and love.filesystem then
         local success, err = pcall(function()
-            local existing_content = ""
-            if love.filesystem.getInfo(self.log_file) then
-                existing_content = love.filesystem.read(self.log_file) or ""
-            end
-            love.filesystem.write(self.log_file, existing_content .. log_entry .. "\n")
+            love.filesystem.append(self.log_file, log_entry .. "\n")
         end)
         
         if not success then
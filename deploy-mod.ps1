@@ -19,7 +19,8 @@ $IncludeFiles = @(
     "debug_logger.lua", 
     "joker_manager.lua",
     "manifest.json",
-    "message_manager.lua"
+    "message_manager.lua",
+    "timestamp_cache.lua"
 )
 
 $IncludeDirectories = @(
@@ -0,0 +1,49 @@
+/**
+ * Unit tests for execute_action argument handling
+ */
+
+import { McpError } from '@modelcontextprotocol/sdk/types.js';
+import { buildActionData, parseExecuteActionArgs } from '../action-args.js';
+
+describe('parseExecuteActionArgs', () => {
+  test('should accept a supported action type with parameters', () => {
+    const args = parseExecuteActionArgs({
+      action_type: 'play_hand',
+      parameters: { card_indices: [0, 1] }
+    });
+
+    expect(args.action_type).toBe('play_hand');
+    expect(args.parameters).toEqual({ card_indices: [0, 1] });
+  });
+
+  test('should accept use_pack_tarot', () => {
+    expect(parseExecuteActionArgs({ action_type: 'use_pack_tarot' }).action_type).toBe('use_pack_tarot');
+  });
+
+  test('should reject unsupported action types', () => {
+    expect(() => parseExecuteActionArgs({ action_type: 'not_an_action' })).toThrow(McpError);
+  });
+
+  test('should reject parameters that override action_type or sequence_id', () => {
+    expect(() => parseExecuteActionArgs({
+      action_type: 'play_hand',
+      parameters: { action_type: 'anything' }
+    })).toThrow(McpError);
+
+    expect(() => parseExecuteActionArgs({
+      action_type: 'play_hand',
+      parameters: { sequence_id: 1 }
+    })).toThrow(McpError);
+  });
+});
+
+describe('buildActionData', () => {
+  test('should keep the validated action type and server sequence ID', () => {
+    const actionData = buildActionData({
+      action_type: 'play_hand',
+      parameters: { action_type: 'anything', sequence_id: 1, card_indices: [2] }
+    }, 42);
+
+    expect(actionData).toEqual({ action_type: 'play_hand', sequence_id: 42, card_indices: [2] });
+  });
+});
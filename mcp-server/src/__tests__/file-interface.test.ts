@@ -5,14 +5,14 @@
 import fs from 'fs/promises';
 import path from 'path';
 import { BalatroMCPFileInterface } from '../file-interface.js';
-import { ActionData } from '../types.js';
+import type { ActionData } from '../types.js';
 
 describe('BalatroMCPFileInterface', () => {
   let fileInterface: BalatroMCPFileInterface;
   let testDir: string;
 
   beforeEach(async () => {
-    testDir = path.join(process.cwd(), 'test-temp', `test-${Date.now()}`);
+    testDir = path.join(process.cwd(), 'test-temp', `test-${process.env.JEST_WORKER_ID ?? '0'}-${Date.now()}`);
     fileInterface = new BalatroMCPFileInterface(testDir);
     await fileInterface.initialize();
   });
@@ -51,7 +51,38 @@ describe('BalatroMCPFileInterface', () => {
       expect(parsedContent.data.action_type).toBe('play_hand');
       expect(parsedContent.data.sequence_id).toBe(42);
       expect(parsedContent.data.card_indices).toEqual([0, 1, 2, 3, 4]);
-      expect(parsedContent.timestamp).toBeDefined();
+      expect(parsedContent.timestamp).toMatch(/^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}Z$/);
+    });
+
+    test('should publish actions.json without leaving a temp file behind', async () => {
+      await fileInterface.writeAction({ action_type: 'go_next', sequence_id: 7 });
+
+      const entries = await fs.readdir(testDir);
+      expect(entries).toEqual(['actions.json']);
+    });
+
+    test('should remove the temp file when publishing fails', async () => {
+      // A non-empty directory in place of actions.json makes the rename fail
+      await fs.mkdir(path.join(testDir, 'actions.json', 'blocker'), { recursive: true });
+      const originalError = console.error;
+      console.error = () => {};
+
+      try {
+        await expect(fileInterface.writeAction({ action_type: 'go_next', sequence_id: 9 })).rejects.toThrow();
+      } finally {
+        console.error = originalError;
+      }
+
+      const entries = await fs.readdir(testDir);
+      expect(entries).not.toContain('actions.json.tmp');
+    });
+
+    test('should write actions.json as one compact JSON payload', async () => {
+      await fileInterface.writeAction({ action_type: 'play_hand', sequence_id: 8, card_indices: [0, 1] });
+
+      const content = await fs.readFile(path.join(testDir, 'actions.json'), 'utf-8');
+      expect(content).toBe(JSON.stringify(JSON.parse(content)));
+      expect(content).not.toContain('\n');
     });
 
     test('should auto-generate sequence ID if not provided', async () => {
@@ -90,6 +121,112 @@ describe('BalatroMCPFileInterface', () => {
       const result = await fileInterface.readGameState();
       expect(result).toEqual(testData);
     });
+
+    test('should re-parse files when their content changes', async () => {
+      const gameStateFile = path.join(testDir, 'game_state.json');
+      const firstData = { timestamp: '2024-01-01T12:00:00Z', sequence_id: 1, message_type: 'game_state', data: { ante: 1 } };
+      const secondData = { ...firstData, sequence_id: 2, data: { ante: 2 } };
+
+      await fs.writeFile(gameStateFile, JSON.stringify(firstData));
+      const first = await fileInterface.readGameState();
+      const firstAgain = await fileInterface.readGameState();
+
+      await fs.writeFile(gameStateFile, JSON.stringify(secondData));
+      const second = await fileInterface.readGameState();
+
+      expect(firstAgain).toBe(first);
+      expect(first).toEqual(firstData);
+      expect(second).toEqual(secondData);
+    });
+
+    test('should return raw file text without re-serializing', async () => {
+      const rawContent = '{"timestamp":"2024-01-01T12:00:00Z","sequence_id":1,"message_type":"game_state"}';
+      await fs.writeFile(path.join(testDir, 'game_state.json'), rawContent);
+
+      const text = await fileInterface.readSharedFileText('game_state.json');
+      expect(text).toBe(rawContent);
+    });
+
+    test('should share concurrent reads without caching later ones', async () => {
+      const gameStateFile = path.join(testDir, 'game_state.json');
+      await fs.writeFile(gameStateFile, '{"sequence_id":1}');
+
+      // Count reads through the same fs/promises object the interface uses
+      const originalReadFile = fs.readFile;
+      let reads = 0;
+      (fs as any).readFile = (...args: unknown[]) => {
+        if (args[0] === gameStateFile) {
+          reads++;
+        }
+        return (originalReadFile as any).apply(fs, args);
+      };
+
+      try {
+        const [first, second] = await Promise.all([
+          fileInterface.readSharedFileText('game_state.json'),
+          fileInterface.readSharedFileText('game_state.json')
+        ]);
+        expect(reads).toBe(1);
+
+        await fs.writeFile(gameStateFile, '{"sequence_id":2}');
+        const later = await fileInterface.readSharedFileText('game_state.json');
+        expect(reads).toBe(2);
+
+        expect(first).toBe('{"sequence_id":1}');
+        expect(second).toBe(first);
+        expect(later).toBe('{"sequence_id":2}');
+      } finally {
+        fs.readFile = originalReadFile;
+      }
+    });
+
+    test('should return null raw text for non-existent files', async () => {
+      const text = await fileInterface.readSharedFileText('deck_state.json');
+      expect(text).toBeNull();
+    });
+
+    test('should treat truncated JSON text as unavailable', async () => {
+      const gameStateFile = path.join(testDir, 'game_state.json');
+      const originalError = console.error;
+      console.error = () => {};
+
+      try {
+        await fs.writeFile(gameStateFile, '{"sequence_id":1,"data":{"pha');
+        expect(await fileInterface.readSharedJsonText('game_state.json')).toBeNull();
+
+        // Cut off right after a nested object, so the text still ends with a brace
+        await fs.writeFile(gameStateFile, '{"data":{"hand_cards":[{"rank":"A","suit":"Spades"}');
+        expect(await fileInterface.readSharedJsonText('game_state.json')).toBeNull();
+      } finally {
+        console.error = originalError;
+      }
+
+      await fs.writeFile(gameStateFile, '{"sequence_id":1}\n');
+      expect(await fileInterface.readSharedJsonText('game_state.json')).toBe('{"sequence_id":1}\n');
+    });
+  });
+
+  describe('read failure logging', () => {
+    test('should back off logging for repeated read failures', async () => {
+      // A directory in place of the file makes every read fail with EISDIR
+      await fs.mkdir(path.join(testDir, 'game_state.json'));
+      const originalError = console.error;
+      let loggedErrors = 0;
+      console.error = () => {
+        loggedErrors++;
+      };
+
+      try {
+        for (let i = 0; i < 5; i++) {
+          expect(await fileInterface.readGameState()).toBeNull();
+        }
+
+        // Failures 1, 2 and 4 are logged; 3 and 5 are suppressed
+        expect(loggedErrors).toBe(3);
+      } finally {
+        console.error = originalError;
+      }
+    });
   });
 
   describe('file listing', () => {
@@ -104,6 +241,39 @@ describe('BalatroMCPFileInterface', () => {
       expect(files).toContain('deck_state.json');
       expect(files).not.toContain('other.txt');
     });
+
+    test('should pick up files added after a previous listing', async () => {
+      await fs.writeFile(path.join(testDir, 'game_state.json'), '{}');
+      expect(await fileInterface.listSharedFiles()).toEqual(['game_state.json']);
+
+      await fs.writeFile(path.join(testDir, 'deck_state.json'), '{}');
+      const files = await fileInterface.listSharedFiles();
+
+      expect(files).toContain('game_state.json');
+      expect(files).toContain('deck_state.json');
+    });
+
+    test('should reuse the listing while the directory mtime is unchanged', async () => {
+      // Backdate the directory well past the timestamp margin so the listing can be cached
+      const settled = new Date(Date.now() - 60_000);
+      await fs.writeFile(path.join(testDir, 'game_state.json'), '{}');
+      await fs.utimes(testDir, settled, settled);
+
+      const first = await fileInterface.listSharedFiles();
+      expect(first).toEqual(['game_state.json']);
+      first.push('mutated.json');
+
+      // Add an entry but restore the mtime, so only a re-list could see it
+      await fs.writeFile(path.join(testDir, 'deck_state.json'), '{}');
+      await fs.utimes(testDir, settled, settled);
+      expect(await fileInterface.listSharedFiles()).toEqual(['game_state.json']);
+
+      const moved = new Date(settled.getTime() + 1000);
+      await fs.utimes(testDir, moved, moved);
+      const relisted = await fileInterface.listSharedFiles();
+      expect(relisted).toContain('deck_state.json');
+      expect(relisted).not.toContain('mutated.json');
+    });
   });
 
   describe('sequence ID management', () => {
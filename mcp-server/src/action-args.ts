@@ -0,0 +1,60 @@
+/**
+ * Argument handling for the execute_action tool
+ */
+
+import { ErrorCode, McpError } from '@modelcontextprotocol/sdk/types.js';
+import { SUPPORTED_ACTION_TYPES, type ActionData, type SupportedActionType } from './types.js';
+
+// Single hash lookup to reject unknown action types before allocating a sequence ID
+const SUPPORTED_ACTION_TYPE_SET: ReadonlySet<string> = new Set(SUPPORTED_ACTION_TYPES);
+
+// Envelope fields the server sets itself; parameters must not override them
+const RESERVED_PARAMETER_KEYS = ['action_type', 'sequence_id'] as const;
+
+export interface ExecuteActionArgs {
+  action_type: SupportedActionType;
+  parameters: Record<string, unknown>;
+}
+
+/**
+ * Validate execute_action arguments in one pass, before any side effects
+ */
+export function parseExecuteActionArgs(args: unknown): ExecuteActionArgs {
+  if (typeof args !== 'object' || args === null) {
+    throw new McpError(ErrorCode.InvalidParams, 'execute_action requires an arguments object');
+  }
+
+  const { action_type, parameters = {} } = args as Record<string, unknown>;
+
+  if (typeof action_type !== 'string' || !SUPPORTED_ACTION_TYPE_SET.has(action_type)) {
+    throw new McpError(ErrorCode.InvalidParams, `Unsupported action type: ${String(action_type)}`);
+  }
+
+  if (typeof parameters !== 'object' || parameters === null || Array.isArray(parameters)) {
+    throw new McpError(ErrorCode.InvalidParams, 'execute_action parameters must be an object');
+  }
+
+  for (const key of RESERVED_PARAMETER_KEYS) {
+    if (Object.prototype.hasOwnProperty.call(parameters, key)) {
+      throw new McpError(ErrorCode.InvalidParams, `execute_action parameters must not set ${key}`);
+    }
+  }
+
+  return {
+    action_type: action_type as SupportedActionType,
+    parameters: parameters as Record<string, unknown>
+  };
+}
+
+/**
+ * Build action data in BalatroMCP format.
+ * Parameters are spread first so the validated action type and the server's
+ * sequence ID always win.
+ */
+export function buildActionData(args: ExecuteActionArgs, sequenceId: number): ActionData {
+  return {
+    ...args.parameters,
+    action_type: args.action_type,
+    sequence_id: sequenceId
+  };
+}
@@ -4,8 +4,8 @@
 
 import fs from 'fs/promises';
 import path from 'path';
-import chokidar from 'chokidar';
-import { 
+import type { FSWatcher } from 'chokidar';
+import type { 
   BalatroMCPMessage, 
   ActionData, 
   GameStateData, 
@@ -15,10 +15,20 @@ import {
   ActionResult 
 } from './types.js';
 
+// Covers the coarsest common filesystem timestamp resolution (2s on FAT)
+const LISTING_TIMESTAMP_MARGIN_MS = 2000;
+
 export class BalatroMCPFileInterface {
   private sharedDir: string;
   private sequenceId: number = 1;
-  private watchers: chokidar.FSWatcher[] = [];
+  private watchers: FSWatcher[] = [];
+  private consecutiveFailures: Map<string, number> = new Map();
+  private filePaths: Map<string, string> = new Map();
+  private parsedFiles: Map<string, { text: string; message: BalatroMCPMessage }> = new Map();
+  private pendingReads: Map<string, Promise<string | null>> = new Map();
+  private sharedFilesListing: { mtimeMs: number; listedAtMs: number; files: string[] } | null = null;
+  private timestampSecond = -1;
+  private timestamp = '';
 
   constructor(sharedDir: string = './shared') {
     this.sharedDir = path.resolve(sharedDir);
@@ -82,7 +92,7 @@ export class BalatroMCPFileInterface {
     }
 
     const message: BalatroMCPMessage = {
-      timestamp: new Date().toISOString().replace(/\.\d{3}Z$/, 'Z'),
+      timestamp: this.getTimestamp(),
       sequence_id: actionData.sequence_id,
       message_type: 'action',
       data: actionData
@@ -92,9 +102,24 @@ export class BalatroMCPFileInterface {
   }
 
   /**
-   * Watch for changes in shared files
+   * ISO timestamp (second precision) for outgoing messages.
+   * Only reformatted when the second changes, since actions tend to arrive in bursts.
    */
-  startWatching(onFileChange: (filename: string, content: BalatroMCPMessage | null) => void): void {
+  private getTimestamp(): string {
+    const second = Math.floor(Date.now() / 1000);
+    if (second !== this.timestampSecond) {
+      this.timestampSecond = second;
+      this.timestamp = new Date(second * 1000).toISOString().slice(0, 19) + 'Z';
+    }
+    return this.timestamp;
+  }
+
+  /**
+   * Watch for changes in shared files.
+   * chokidar is only loaded here, so code that never watches doesn't pay for importing it.
+   */
+  async startWatching(onFileChange: (filename: string, content: BalatroMCPMessage | null) => void): Promise<void> {
+    const { watch } = await import('chokidar');
     const filesToWatch = [
       'game_state.json',
       'deck_state.json', 
@@ -105,7 +130,7 @@ export class BalatroMCPFileInterface {
 
     filesToWatch.forEach(filename => {
       const filepath = path.join(this.sharedDir, filename);
-      const watcher = chokidar.watch(filepath, {
+      const watcher = watch(filepath, {
         ignoreInitial: false,
         persistent: true
       });
@@ -143,12 +168,24 @@ export class BalatroMCPFileInterface {
   }
 
   /**
-   * List all available shared files
+   * List all available shared files.
+   * The directory mtime only changes when entries are added, removed or renamed,
+   * so the last listing is reused until it moves. Filesystem timestamps are coarse,
+   * so a listing taken too soon after the mtime is never trusted: an entry added in
+   * the same timestamp tick would not move the mtime.
    */
   async listSharedFiles(): Promise<string[]> {
     try {
-      const files = await fs.readdir(this.sharedDir);
-      return files.filter(file => file.endsWith('.json'));
+      const { mtimeMs } = await fs.stat(this.sharedDir);
+      const cached = this.sharedFilesListing;
+      if (cached && cached.mtimeMs === mtimeMs && cached.listedAtMs - mtimeMs > LISTING_TIMESTAMP_MARGIN_MS) {
+        return [...cached.files];
+      }
+
+      const listedAtMs = Date.now();
+      const files = (await fs.readdir(this.sharedDir)).filter(file => file.endsWith('.json'));
+      this.sharedFilesListing = { mtimeMs, listedAtMs, files };
+      return [...files];
     } catch (error) {
       console.error('Failed to list shared files:', error);
       return [];
@@ -156,35 +193,148 @@ export class BalatroMCPFileInterface {
   }
 
   /**
-   * Generic JSON file reader
+   * Read the raw contents of a shared file without parsing it.
+   * Lets callers that only forward the JSON text skip a parse/stringify round-trip.
+   * Concurrent reads of the same file share a single in-flight fetch.
    */
-  private async readJsonFile(filename: string): Promise<BalatroMCPMessage | null> {
-    const filepath = path.join(this.sharedDir, filename);
+  async readSharedFileText(filename: string): Promise<string | null> {
+    const pending = this.pendingReads.get(filename);
+    if (pending) {
+      return pending;
+    }
+
+    const read = this.fetchSharedFileText(filename);
+    this.pendingReads.set(filename, read);
+    try {
+      return await read;
+    } finally {
+      this.pendingReads.delete(filename);
+    }
+  }
+
+  /**
+   * Raw text of a shared JSON file, or null if it is missing or doesn't parse.
+   * The mod rewrites its files in place, so a read can land mid-write; only text
+   * that parses is served. Parses are cached on the exact text, so unchanged files
+   * cost a string compare.
+   */
+  async readSharedJsonText(filename: string): Promise<string | null> {
+    const text = await this.readSharedFileText(filename);
+    if (text === null || this.parseSharedText(filename, text) === null) {
+      return null;
+    }
+    return text;
+  }
+
+  private async fetchSharedFileText(filename: string): Promise<string | null> {
+    const filepath = this.resolvePath(filename);
     
     try {
       const content = await fs.readFile(filepath, 'utf-8');
-      return JSON.parse(content) as BalatroMCPMessage;
+      this.clearFailures('read', filename);
+      return content;
     } catch (error) {
       if ((error as any).code === 'ENOENT') {
         return null; // File doesn't exist yet
       }
-      console.error(`Failed to read ${filename}:`, error);
+      this.logFailure('read', filename, error);
       return null;
     }
   }
 
   /**
-   * Generic JSON file writer
+   * Absolute path of a shared file, resolved once per name since the same few
+   * files are read and written on every tool call
+   */
+  private resolvePath(filename: string): string {
+    let filepath = this.filePaths.get(filename);
+    if (filepath === undefined) {
+      filepath = path.join(this.sharedDir, filename);
+      this.filePaths.set(filename, filepath);
+    }
+    return filepath;
+  }
+
+  /**
+   * Generic JSON file reader.
+   * The mod rewrites files with identical content many times per second, so the last
+   * parse of each file is kept and reused while the raw text is unchanged.
+   * Returned messages may be shared between calls and must not be mutated.
+   */
+  private async readJsonFile(filename: string): Promise<BalatroMCPMessage | null> {
+    const content = await this.readSharedFileText(filename);
+    if (content === null) {
+      return null;
+    }
+    
+    return this.parseSharedText(filename, content);
+  }
+
+  /**
+   * Parse shared file text, reusing the cached parse while the text is unchanged
+   */
+  private parseSharedText(filename: string, content: string): BalatroMCPMessage | null {
+    const cached = this.parsedFiles.get(filename);
+    if (cached && cached.text === content) {
+      return cached.message;
+    }
+    
+    try {
+      const message = JSON.parse(content) as BalatroMCPMessage;
+      this.parsedFiles.set(filename, { text: content, message });
+      this.clearFailures('parse', filename);
+      return message;
+    } catch (error) {
+      this.logFailure('parse', filename, error);
+      return null;
+    }
+  }
+
+  /**
+   * Log a failed file operation with exponential backoff.
+   * Only the 1st, 2nd, 4th, 8th... consecutive failure per file is reported, so a
+   * persistently unreadable file does not flood the log on every watcher event.
+   */
+  private logFailure(operation: 'read' | 'parse', filename: string, error: unknown): void {
+    const key = `${operation}:${filename}`;
+    const failures = (this.consecutiveFailures.get(key) ?? 0) + 1;
+    this.consecutiveFailures.set(key, failures);
+    
+    if ((failures & (failures - 1)) === 0) {
+      const suffix = failures > 1 ? ` (${failures} consecutive failures)` : '';
+      console.error(`Failed to ${operation} ${filename}${suffix}:`, error);
+    }
+  }
+
+  /**
+   * Reset the failure count for a file after a successful operation
+   */
+  private clearFailures(operation: 'read' | 'parse', filename: string): void {
+    if (this.consecutiveFailures.size > 0) {
+      this.consecutiveFailures.delete(`${operation}:${filename}`);
+    }
+  }
+
+  /**
+   * Generic JSON file writer.
+   * Writes to a sibling temp file and renames it into place, so the mod polling the
+   * file never reads a partially written message.
    */
   private async writeJsonFile(filename: string, data: BalatroMCPMessage): Promise<void> {
-    const filepath = path.join(this.sharedDir, filename);
+    const filepath = this.resolvePath(filename);
+    const tempPath = this.resolvePath(`${filename}.tmp`);
     
     try {
-      const jsonContent = JSON.stringify(data, null, 2);
-      await fs.writeFile(filepath, jsonContent, 'utf-8');
+      // Compact output: the mod's JSON decoder doesn't need the indentation,
+      // and skipping it makes stringify cheaper and the file smaller
+      const jsonContent = JSON.stringify(data);
+      await fs.writeFile(tempPath, jsonContent, 'utf-8');
+      await fs.rename(tempPath, filepath);
       console.log(`Wrote ${filename}`);
     } catch (error) {
       console.error(`Failed to write ${filename}:`, error);
+      // Don't leave a stale temp file behind, e.g. when the mod holds the target open on Windows
+      await fs.rm(tempPath, { force: true }).catch(() => {});
       throw error;
     }
   }
@@ -7,19 +7,129 @@
 import { Server } from '@modelcontextprotocol/sdk/server/index.js';
 import { StdioServerTransport } from '@modelcontextprotocol/sdk/server/stdio.js';
 import {
+  type CallToolRequest,
   CallToolRequestSchema,
   ErrorCode,
   ListResourcesRequestSchema,
   ListToolsRequestSchema,
   McpError,
+  type ReadResourceRequest,
   ReadResourceRequestSchema,
 } from '@modelcontextprotocol/sdk/types.js';
 import { BalatroMCPFileInterface } from './file-interface.js';
-import { ActionData, SupportedActionType } from './types.js';
+import { buildActionData, parseExecuteActionArgs, type ExecuteActionArgs } from './action-args.js';
+import { SUPPORTED_ACTION_TYPES } from './types.js';
+
+// Per-file change logging is noisy while the mod is pushing state; opt in with BALATROMCP_DEBUG=1
+const DEBUG_LOGGING = process.env.BALATROMCP_DEBUG === '1';
+
+// Tool definitions are static, so the list response is built once
+const LIST_TOOLS_RESULT = {
+  tools: [
+    {
+      name: 'execute_action',
+      description: 'Execute a BalatroMCP action (play_hand, select_blind, buy_item, etc.)',
+      inputSchema: {
+        type: 'object' as const,
+        properties: {
+          action_type: {
+            type: 'string',
+            description: 'Type of action to execute',
+            enum: [...SUPPORTED_ACTION_TYPES]
+          },
+          parameters: {
+            type: 'object',
+            description: 'Action-specific parameters',
+            additionalProperties: true
+          }
+        },
+        required: ['action_type']
+      }
+    },
+    {
+      name: 'get_action_results',
+      description: 'Get the latest action execution results',
+      inputSchema: {
+        type: 'object' as const,
+        properties: {},
+        additionalProperties: false
+      }
+    },
+    {
+      name: 'list_shared_files',
+      description: 'List all available shared JSON files',
+      inputSchema: {
+        type: 'object' as const,
+        properties: {},
+        additionalProperties: false
+      }
+    }
+  ]
+};
+
+interface SharedFileResource {
+  uri: string;
+  mimeType: string;
+  name: string;
+  description: string;
+  filename: string;
+  missingText: string;
+}
+
+/**
+ * Resources backed by BalatroMCP shared files
+ */
+const SHARED_FILE_RESOURCES: SharedFileResource[] = [
+  {
+    uri: 'balatromcp://game_state',
+    mimeType: 'application/json',
+    name: 'Game State',
+    description: 'Current Balatro game state including cards, money, phase, etc.',
+    filename: 'game_state.json',
+    missingText: '{"error": "No game state available"}'
+  },
+  {
+    uri: 'balatromcp://deck_state',
+    mimeType: 'application/json',
+    name: 'Deck State',
+    description: 'Current deck composition and card information',
+    filename: 'deck_state.json',
+    missingText: '{"error": "No deck state available"}'
+  },
+  {
+    uri: 'balatromcp://hand_levels',
+    mimeType: 'application/json',
+    name: 'Hand Levels',
+    description: 'Poker hand statistics and levels',
+    filename: 'hand_levels.json',
+    missingText: '{"error": "No hand levels available"}'
+  },
+  {
+    uri: 'balatromcp://vouchers_ante',
+    mimeType: 'application/json',
+    name: 'Vouchers and Ante',
+    description: 'Voucher information and ante requirements',
+    filename: 'vouchers_ante.json',
+    missingText: '{"error": "No vouchers ante available"}'
+  }
+];
+
+// Resource listing never changes, so build the response and URI lookup once
+const LIST_RESOURCES_RESULT = {
+  resources: SHARED_FILE_RESOURCES.map(({ uri, mimeType, name, description }) => ({
+    uri,
+    mimeType,
+    name,
+    description
+  }))
+};
+
+const RESOURCES_BY_URI = new Map(SHARED_FILE_RESOURCES.map(resource => [resource.uri, resource]));
 
 class BalatroMCPServer {
   private server: Server;
   private fileInterface: BalatroMCPFileInterface;
+  private shuttingDown = false;
 
   constructor(sharedDir?: string) {
     this.fileInterface = new BalatroMCPFileInterface(sharedDir);
@@ -32,201 +142,79 @@ class BalatroMCPServer {
   }
 
   private setupHandlers() {
-    // List available tools
-    this.server.setRequestHandler(ListToolsRequestSchema, async () => {
-      return {
-        tools: [
-          {
-            name: 'execute_action',
-            description: 'Execute a BalatroMCP action (play_hand, select_blind, buy_item, etc.)',
-            inputSchema: {
-              type: 'object',
-              properties: {
-                action_type: {
-                  type: 'string',
-                  description: 'Type of action to execute',
-                  enum: [
-                    'skip_blind', 'select_blind', 'play_hand', 'discard_cards',
-                    'go_to_shop', 'buy_item', 'sell_joker', 'sell_consumable',
-                    'use_consumable', 'reorder_jokers', 'reroll_boss', 'reroll_shop',
-                    'sort_hand_by_rank', 'sort_hand_by_suit', 'move_playing_card',
-                    'select_pack_offer', 'go_next', 'diagnose_blind_progression',
-                    'diagnose_blind_activation'
-                  ]
-                },
-                parameters: {
-                  type: 'object',
-                  description: 'Action-specific parameters',
-                  additionalProperties: true
-                }
-              },
-              required: ['action_type']
-            }
-          },
-          {
-            name: 'get_action_results',
-            description: 'Get the latest action execution results',
-            inputSchema: {
-              type: 'object',
-              properties: {},
-              additionalProperties: false
-            }
-          },
-          {
-            name: 'list_shared_files',
-            description: 'List all available shared JSON files',
-            inputSchema: {
-              type: 'object',
-              properties: {},
-              additionalProperties: false
-            }
-          }
-        ]
-      };
-    });
+    this.server.setRequestHandler(ListToolsRequestSchema, async () => LIST_TOOLS_RESULT);
+    this.server.setRequestHandler(ListResourcesRequestSchema, async () => LIST_RESOURCES_RESULT);
+    this.server.setRequestHandler(ReadResourceRequestSchema, (request) => this.handleReadResource(request));
+    this.server.setRequestHandler(CallToolRequestSchema, (request) => this.handleCallTool(request));
+  }
 
-    // List available resources
-    this.server.setRequestHandler(ListResourcesRequestSchema, async () => {
-      return {
-        resources: [
-          {
-            uri: 'balatromcp://game_state',
-            mimeType: 'application/json',
-            name: 'Game State',
-            description: 'Current Balatro game state including cards, money, phase, etc.'
-          },
-          {
-            uri: 'balatromcp://deck_state', 
-            mimeType: 'application/json',
-            name: 'Deck State',
-            description: 'Current deck composition and card information'
-          },
-          {
-            uri: 'balatromcp://hand_levels',
-            mimeType: 'application/json', 
-            name: 'Hand Levels',
-            description: 'Poker hand statistics and levels'
-          },
-          {
-            uri: 'balatromcp://vouchers_ante',
-            mimeType: 'application/json',
-            name: 'Vouchers and Ante',
-            description: 'Voucher information and ante requirements'
-          }
-        ]
-      };
-    });
+  /**
+   * Read a shared-file resource
+   */
+  private async handleReadResource(request: ReadResourceRequest) {
+    const { uri } = request.params;
+    
+    const resource = RESOURCES_BY_URI.get(uri);
+    if (!resource) {
+      throw new McpError(ErrorCode.InvalidRequest, `Unknown resource: ${uri}`);
+    }
+    
+    const text = await this.fileInterface.readSharedJsonText(resource.filename);
+    return {
+      contents: [
+        {
+          uri,
+          mimeType: resource.mimeType,
+          text: text || resource.missingText
+        }
+      ]
+    };
+  }
 
-    // Read resources
-    this.server.setRequestHandler(ReadResourceRequestSchema, async (request) => {
-      const { uri } = request.params;
+  /**
+   * Dispatch a tool call
+   */
+  private async handleCallTool(request: CallToolRequest) {
+    const { name, arguments: args } = request.params;
+    
+    switch (name) {
+      case 'execute_action': {
+        return await this.executeAction(parseExecuteActionArgs(args));
+      }
       
-      switch (uri) {
-        case 'balatromcp://game_state': {
-          const gameState = await this.fileInterface.readGameState();
-          return {
-            contents: [
-              {
-                uri,
-                mimeType: 'application/json',
-                text: gameState ? JSON.stringify(gameState, null, 2) : '{"error": "No game state available"}'
-              }
-            ]
-          };
-        }
-        
-        case 'balatromcp://deck_state': {
-          const deckState = await this.fileInterface.readDeckState();
-          return {
-            contents: [
-              {
-                uri,
-                mimeType: 'application/json',
-                text: deckState ? JSON.stringify(deckState, null, 2) : '{"error": "No deck state available"}'
-              }
-            ]
-          };
-        }
-        
-        case 'balatromcp://hand_levels': {
-          const handLevels = await this.fileInterface.readHandLevels();
-          return {
-            contents: [
-              {
-                uri,
-                mimeType: 'application/json',
-                text: handLevels ? JSON.stringify(handLevels, null, 2) : '{"error": "No hand levels available"}'
-              }
-            ]
-          };
-        }
-        
-        case 'balatromcp://vouchers_ante': {
-          const vouchersAnte = await this.fileInterface.readVouchersAnte();
-          return {
-            contents: [
-              {
-                uri,
-                mimeType: 'application/json',
-                text: vouchersAnte ? JSON.stringify(vouchersAnte, null, 2) : '{"error": "No vouchers ante available"}'
-              }
-            ]
-          };
-        }
-        
-        default:
-          throw new McpError(ErrorCode.InvalidRequest, `Unknown resource: ${uri}`);
+      case 'get_action_results': {
+        // Forward the mod's JSON text as-is instead of parsing and re-serializing it
+        const results = await this.fileInterface.readSharedJsonText('action_results.json');
+        return {
+          content: [
+            {
+              type: 'text' as const,
+              text: results || 'No action results available'
+            }
+          ]
+        };
       }
-    });
-
-    // Handle tool calls
-    this.server.setRequestHandler(CallToolRequestSchema, async (request) => {
-      const { name, arguments: args } = request.params;
       
-      switch (name) {
-        case 'execute_action': {
-          return await this.executeAction(args as any);
-        }
-        
-        case 'get_action_results': {
-          const results = await this.fileInterface.readActionResults();
-          return {
-            content: [
-              {
-                type: 'text',
-                text: results ? JSON.stringify(results, null, 2) : 'No action results available'
-              }
-            ]
-          };
-        }
-        
-        case 'list_shared_files': {
-          const files = await this.fileInterface.listSharedFiles();
-          return {
-            content: [
-              {
-                type: 'text',
-                text: JSON.stringify({ files }, null, 2)
-              }
-            ]
-          };
-        }
-        
-        default:
-          throw new McpError(ErrorCode.MethodNotFound, `Unknown tool: ${name}`);
+      case 'list_shared_files': {
+        const files = await this.fileInterface.listSharedFiles();
+        return {
+          content: [
+            {
+              type: 'text' as const,
+              text: JSON.stringify({ files }, null, 2)
+            }
+          ]
+        };
       }
-    });
+      
+      default:
+        throw new McpError(ErrorCode.MethodNotFound, `Unknown tool: ${name}`);
+    }
   }
 
-  private async executeAction(args: { action_type: SupportedActionType; parameters?: any }): Promise<any> {
-    const { action_type, parameters = {} } = args;
-    
-    // Build action data in BalatroMCP format
-    const actionData: ActionData = {
-      action_type,
-      sequence_id: this.fileInterface.getNextSequenceId(),
-      ...parameters
-    };
+  private async executeAction(args: ExecuteActionArgs): Promise<any> {
+    const { action_type } = args;
+    const actionData = buildActionData(args, this.fileInterface.getNextSequenceId());
 
     try {
       await this.fileInterface.writeAction(actionData);
@@ -247,21 +235,39 @@ class BalatroMCPServer {
     }
   }
 
+  private async shutdown(): Promise<void> {
+    if (this.shuttingDown) {
+      return;
+    }
+    this.shuttingDown = true;
+    
+    console.log('Shutting down BalatroMCP server...');
+    this.fileInterface.stopWatching();
+    
+    try {
+      await this.server.close();
+    } catch (error) {
+      console.error('Failed to close MCP server:', error);
+    }
+    
+    process.exit(0);
+  }
+
   async run() {
     // Initialize file interface
     await this.fileInterface.initialize();
     
     // Start file watching for real-time updates
-    this.fileInterface.startWatching((filename, content) => {
-      console.log(`File updated: ${filename}`);
+    await this.fileInterface.startWatching((filename, content) => {
+      if (DEBUG_LOGGING) {
+        console.log(`File updated: ${filename}`);
+      }
     });
 
-    // Set up cleanup on exit
-    process.on('SIGINT', () => {
-      console.log('Shutting down BalatroMCP server...');
-      this.fileInterface.stopWatching();
-      process.exit(0);
-    });
+    // Set up cleanup on exit; process managers stop the server with SIGTERM
+    for (const signal of ['SIGINT', 'SIGTERM'] as const) {
+      process.once(signal, () => void this.shutdown());
+    }
 
     // Start the server
     const transport = new StdioServerTransport();
@@ -4,7 +4,7 @@
  */
 
 import { BalatroMCPFileInterface } from './file-interface.js';
-import { ActionData } from './types.js';
+import type { ActionData } from './types.js';
 
 async function testFileInterface() {
   console.log('Testing BalatroMCP File Interface...');
@@ -60,23 +60,30 @@ export interface ActionResult {
   timestamp: string;
 }
 
-export type SupportedActionType = 
-  | "skip_blind"
-  | "select_blind" 
-  | "play_hand"
-  | "discard_cards"
-  | "go_to_shop"
-  | "buy_item"
-  | "sell_joker"
-  | "sell_consumable"
-  | "use_consumable"
-  | "reorder_jokers"
-  | "reroll_boss"
-  | "reroll_shop"
-  | "sort_hand_by_rank"
-  | "sort_hand_by_suit"
-  | "move_playing_card"
-  | "select_pack_offer"
-  | "go_next"
-  | "diagnose_blind_progression"
-  | "diagnose_blind_activation";
\ No newline at end of file
+/**
+ * Action types understood by the BalatroMCP mod's action executor
+ */
+export const SUPPORTED_ACTION_TYPES = [
+  'skip_blind',
+  'select_blind',
+  'play_hand',
+  'discard_cards',
+  'go_to_shop',
+  'buy_item',
+  'sell_joker',
+  'sell_consumable',
+  'use_consumable',
+  'reorder_jokers',
+  'reroll_boss',
+  'reroll_shop',
+  'sort_hand_by_rank',
+  'sort_hand_by_suit',
+  'move_playing_card',
+  'select_pack_offer',
+  'use_pack_tarot',
+  'go_next',
+  'diagnose_blind_progression',
+  'diagnose_blind_activation'
+] as const;
+
+export type SupportedActionType = typeof SUPPORTED_ACTION_TYPES[number];
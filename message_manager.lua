@@ -2,6 +2,14 @@
 -- Follows Single Responsibility Principle - focused on message structure and coordination
 -- Uses Dependency Injection - accepts IMessageTransport implementation
 
+-- Shared per-second timestamp formatting; plain require covers test environments without SMODS
+local TimestampCache
+if SMODS and SMODS.load_file then
+    TimestampCache = assert(SMODS.load_file("timestamp_cache.lua"))()
+else
+    TimestampCache = require("timestamp_cache")
+end
+
 local MessageManager = {}
 MessageManager.__index = MessageManager
 
@@ -21,6 +29,7 @@ function MessageManager.new(transport, component_name)
     local self = setmetatable({}, MessageManager)
     self.transport = transport
     self.sequence_id = 0
+    self.timestamp_cache = TimestampCache.new("!%Y-%m-%dT%H:%M:%SZ")
     self.component_name = component_name or "MESSAGE_MANAGER"
     
     -- Load JSON library via SMODS
@@ -64,7 +73,7 @@ function MessageManager:create_message(data, message_type)
     end
     
     local message = {
-        timestamp = os.date("!%Y-%m-%dT%H:%M:%SZ"),
+        timestamp = self.timestamp_cache:get(),
         sequence_id = self:get_next_sequence_id(),
         message_type = message_type,
         data = data
@@ -161,28 +161,26 @@ function StateExtractor:extract_remaining_deck_cards()
     return {}
 end
 
+-- Global G properties validate_g_object requires. The per-area validate_* helpers
+-- below perform no checks, so validation only needs to confirm these exist and can
+-- stop at the first missing one
+local CRITICAL_G_PROPERTIES = {
+    "STATE", "STATES", "GAME", "hand", "jokers", "consumeables", "shop_jokers", "FUNCS"
+}
+
 -- Original validation methods preserved for backward compatibility
 function StateExtractor:validate_g_object()
     if not G then
         return false
     end
     
-    local critical_properties = {
-        "STATE", "STATES", "GAME", "hand", "jokers", "consumeables", "shop_jokers", "FUNCS"
-    }
-    
-    local missing_properties = {}
-    for _, prop in ipairs(critical_properties) do
+    for _, prop in ipairs(CRITICAL_G_PROPERTIES) do
         if G[prop] == nil then
-            table.insert(missing_properties, prop)
+            return false
         end
     end
     
-    self:validate_game_object()
-    self:validate_card_areas()
-    self:validate_states()
-    
-    return #missing_properties == 0
+    return true
 end
 
 function StateExtractor:validate_game_object()
@@ -195,6 +195,11 @@ function luaunit_helpers.setup_mock_love_filesystem()
             return true
         end,
         
+        append = function(path, content)
+            love.filesystem.files[path] = (love.filesystem.files[path] or "") .. content
+            return true
+        end,
+        
         read = function(path)
             local content = love.filesystem.files[path]
             if content then
@@ -212,6 +217,18 @@ function luaunit_helpers.setup_mock_love_filesystem()
             return false
         end,
         
+        getDirectoryItems = function(dir)
+            local prefix = (dir == "" or dir == ".") and "" or (dir .. "/")
+            local items = {}
+            for path in pairs(love.filesystem.files) do
+                local name = path:sub(#prefix + 1)
+                if path:sub(1, #prefix) == prefix and not name:find("/") then
+                    table.insert(items, name)
+                end
+            end
+            return items
+        end,
+        
         isFused = function()
             return false -- Mock always returns false (development mode)
         end
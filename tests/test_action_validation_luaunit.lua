@@ -4,21 +4,30 @@
 local luaunit = require('libs.luaunit')
 local luaunit_helpers = require('tests.luaunit_helpers')
 
--- Load validation components for testing
+-- Load validation components for testing.
+-- Loaded once and shared by every test case; tests only create instances from
+-- these modules and never modify the module tables themselves.
+local validation_components = nil
+
 local function load_validation_components()
+    if validation_components then
+        return validation_components
+    end
+    
     local ValidationResult = assert(SMODS.load_file("action_executor/validators/validation_result.lua"))()
     local ActionValidator = assert(SMODS.load_file("action_executor/validators/action_validator.lua"))()
     local BlindValidator = assert(SMODS.load_file("action_executor/validators/blind_validator.lua"))()
     local RerollValidator = assert(SMODS.load_file("action_executor/validators/reroll_validator.lua"))()
     local RerollTracker = assert(SMODS.load_file("action_executor/utils/reroll_tracker.lua"))()
     
-    return {
+    validation_components = {
         ValidationResult = ValidationResult,
         ActionValidator = ActionValidator,
         BlindValidator = BlindValidator,
         RerollValidator = RerollValidator,
         RerollTracker = RerollTracker
     }
+    return validation_components
 end
 
 -- Test ValidationResult functionality
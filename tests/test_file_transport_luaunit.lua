@@ -240,6 +240,58 @@ local function TestFileTransportReadMessageFileNotFound()
     tearDown()
 end
 
+local function TestFileTransportReadMessageSkipsExistenceCheck()
+    setUp()
+    
+    local transport = FileTransport.new("test_shared")
+    love.filesystem.files["test_shared/game_state.json"] = '{"sequence_id": 1}'
+    
+    local getinfo_calls = 0
+    local original_getInfo = love.filesystem.getInfo
+    love.filesystem.getInfo = function(path)
+        if path:match("%.json$") then
+            getinfo_calls = getinfo_calls + 1
+        end
+        return original_getInfo(path)
+    end
+    
+    luaunit.assertNotNil(transport:read_message("game_state"), "Should read existing file")
+    luaunit.assertNil(transport:read_message("nonexistent"), "Should return nil when file not found")
+    luaunit.assertEquals(0, getinfo_calls, "Should not probe file existence before reading")
+    
+    love.filesystem.getInfo = original_getInfo
+    tearDown()
+end
+
+local function TestFileTransportReadMessageReportsReadErrors()
+    setUp()
+    
+    -- Synchronous path, so the callback runs before read_message returns
+    love.thread = nil
+    
+    local transport = FileTransport.new("test_shared")
+    
+    local original_read = love.filesystem.read
+    love.filesystem.read = function(path)
+        if path == "test_shared/game_state.json" then
+            return nil, "Could not read file test_shared/game_state.json. Permission denied."
+        end
+        return original_read(path)
+    end
+    
+    local callback_success = nil
+    local result = transport:read_message("game_state", function(success, data)
+        callback_success = success
+    end)
+    
+    luaunit.assertNil(result, "Should return nil when the file can't be read")
+    luaunit.assertFalse(callback_success, "Should report read errors as failures")
+    luaunit.assertStrContains(love.filesystem.files["test_shared/file_transport_debug.log"], "Permission denied", "Should log the read error")
+    
+    love.filesystem.read = original_read
+    tearDown()
+end
+
 local function TestFileTransportReadActionsWithSequenceTracking()
     setUp()
     
@@ -452,6 +504,31 @@ local function TestFileTransportCleanupWithCurrentDirectory()
     tearDown()
 end
 
+local function TestFileTransportCleanupOnlyChecksPresentFiles()
+    setUp()
+    
+    local transport = FileTransport.new("test_shared")
+    love.filesystem.files["test_shared/game_state.json"] = '{"test": "data"}'
+    
+    local checked_paths = {}
+    local original_getInfo = love.filesystem.getInfo
+    love.filesystem.getInfo = function(path)
+        if path:match("%.json$") then
+            table.insert(checked_paths, path)
+        end
+        return original_getInfo(path)
+    end
+    
+    local success = transport:cleanup_old_messages(300)
+    
+    luaunit.assertTrue(success, "Should successfully run cleanup")
+    luaunit.assertEquals({"test_shared/game_state.json"}, checked_paths, "Should only stat managed files that exist")
+    luaunit.assertNotNil(love.filesystem.files["test_shared/game_state.json"], "Should keep recent files")
+    
+    love.filesystem.getInfo = original_getInfo
+    tearDown()
+end
+
 local function TestFileTransportCleanupErrorHandling()
     setUp()
     
@@ -502,6 +579,62 @@ local function TestFileTransportLogging()
     tearDown()
 end
 
+local function TestFileTransportLoggingAppendsWithoutRereading()
+    setUp()
+    
+    local transport = FileTransport.new("test_shared")
+    
+    local read_calls = 0
+    local original_read = love.filesystem.read
+    love.filesystem.read = function(path)
+        read_calls = read_calls + 1
+        return original_read(path)
+    end
+    
+    transport:log("First message")
+    transport:log("Second message")
+    
+    local log_content = love.filesystem.files["test_shared/file_transport_debug.log"]
+    luaunit.assertStrContains(log_content, "First message", "Should keep earlier log lines")
+    luaunit.assertStrContains(log_content, "Second message", "Should append new log lines")
+    luaunit.assertEquals(0, read_calls, "Should not read the log back before writing")
+    
+    love.filesystem.read = original_read
+    tearDown()
+end
+
+local function TestFileTransportLoggingReusesTimestampWithinSecond()
+    setUp()
+    
+    local transport = FileTransport.new("test_shared")
+    
+    local original_time = os.time
+    local original_date = os.date
+    local date_calls = 0
+    os.time = function() return 1700000000 end
+    os.date = function(format, time)
+        date_calls = date_calls + 1
+        return original_date(format, time)
+    end
+    
+    local success, err = pcall(function()
+        transport:log("First timed message")
+        transport:log("Second timed message")
+    end)
+    
+    os.time = original_time
+    os.date = original_date
+    
+    luaunit.assertTrue(success, "Should log messages: " .. tostring(err))
+    local expected_timestamp = "[" .. original_date("%Y-%m-%d %H:%M:%S", 1700000000) .. "]"
+    local log_content = love.filesystem.files["test_shared/file_transport_debug.log"]
+    luaunit.assertNotNil(string.find(log_content, expected_timestamp .. " First timed message", 1, true), "Should stamp log lines with the current time")
+    luaunit.assertNotNil(string.find(log_content, expected_timestamp .. " Second timed message", 1, true), "Should reuse timestamp within the same second")
+    luaunit.assertEquals(1, date_calls, "Should format the timestamp only once per second")
+    
+    tearDown()
+end
+
 local function TestFileTransportLoggingWithCurrentDirectory()
     setUp()
     
@@ -521,26 +654,55 @@ end
 -- ASYNC OPERATION TESTS
 -- =============================================================================
 
-local function TestFileTransportAsyncInitialization()
-    setUp()
+-- Mock love.thread with a worker thread and request/response channels.
+-- Requests pushed by the transport are recorded in mock.requests, responses are
+-- popped from mock.responses, and the worker stops running once asked to exit.
+local function setup_mock_love_thread(responses)
+    local mock = {
+        requests = {},
+        responses = responses or {},
+        exit_requested = false
+    }
     
-    -- Mock love.thread
     local mock_thread = {
         start = function() end,
-        isRunning = function() return true end
+        isRunning = function() return not mock.exit_requested end
     }
     
+    if not love then love = {} end
     love.thread = {
         newThread = function(code) return mock_thread end,
-        getChannel = function(name) 
-            return {
-                push = function(data) end,
-                pop = function() return nil end,
-                demand = function() return nil end
-            }
+        getChannel = function(name)
+            if name == 'file_requests' then
+                return {
+                    push = function(channel, request)
+                        table.insert(mock.requests, request)
+                        if request.operation == 'exit' then
+                            mock.exit_requested = true
+                        end
+                    end,
+                    pop = function() return nil end,
+                    demand = function() return nil end
+                }
+            elseif name == 'file_responses' then
+                return {
+                    push = function(channel, response) table.insert(mock.responses, response) end,
+                    pop = function() return table.remove(mock.responses, 1) end,
+                    demand = function() return nil end
+                }
+            else
+                error("Unknown channel: " .. name)
+            end
         end
     }
     
+    return mock
+end
+
+local function TestFileTransportAsyncInitialization()
+    setUp()
+    setup_mock_love_thread()
+    
     local transport = FileTransport.new("test_shared")
     
     luaunit.assertTrue(transport.async_enabled, "Should enable async operations when threading available")
@@ -571,35 +733,7 @@ local function TestFileTransportAsyncWriteMessage()
     setUp()
     
     -- Mock async environment BEFORE creating transport
-    local requests = {}
-    local responses = {}
-    local mock_thread = {
-        start = function() end,
-        isRunning = function() return true end
-    }
-    
-    -- Set up love.thread mock before transport initialization
-    if not love then love = {} end
-    love.thread = {
-        newThread = function(code) return mock_thread end,
-        getChannel = function(name) 
-            if name == 'file_requests' then
-                return {
-                    push = function(data) table.insert(requests, data) end,
-                    pop = function() return nil end,
-                    demand = function() return nil end
-                }
-            elseif name == 'file_responses' then
-                return {
-                    push = function(data) table.insert(responses, data) end,
-                    pop = function() return #responses > 0 and table.remove(responses, 1) or nil end,
-                    demand = function() return nil end
-                }
-            else
-                error("Unknown channel: " .. name)
-            end
-        end
-    }
+    local mock = setup_mock_love_thread()
     
     local transport = FileTransport.new("test_shared")
     local callback_called = false
@@ -612,9 +746,9 @@ local function TestFileTransportAsyncWriteMessage()
     end)
     
     luaunit.assertTrue(result, "Should return true for async operation submission")
-    -- Note: Due to mock channel implementation complexity, we verify async operation
-    -- by checking that the operation returns true (indicating async submission)
-    -- rather than checking internal request structure
+    luaunit.assertEquals(1, #mock.requests, "Should submit one request to the worker")
+    luaunit.assertEquals("write", mock.requests[1].operation, "Should submit a write request")
+    luaunit.assertEquals("test_shared/game_state.json", mock.requests[1].filepath, "Should write to the message file")
     luaunit.assertFalse(callback_called, "Callback should not be called immediately")
     luaunit.assertEquals(false, callback_success, "Callback success should still be false")
     
@@ -625,23 +759,7 @@ local function TestFileTransportAsyncReadMessage()
     setUp()
     
     -- Mock async environment BEFORE transport initialization
-    local requests = {}
-    local mock_thread = {
-        start = function() end,
-        isRunning = function() return true end
-    }
-    
-    if not love then love = {} end
-    love.thread = {
-        newThread = function(code) return mock_thread end,
-        getChannel = function(name) 
-            return {
-                push = function(data) table.insert(requests, data) end,
-                pop = function() return nil end,
-                demand = function() return nil end
-            }
-        end
-    }
+    local mock = setup_mock_love_thread()
     
     local transport = FileTransport.new("test_shared")
     local callback_called = false
@@ -658,6 +776,40 @@ local function TestFileTransportAsyncReadMessage()
     luaunit.assertNil(result, "Should return nil for async operation")
     -- Note: read_message intentionally returns nil for async operations
     luaunit.assertFalse(callback_called, "Callback should not be called immediately")
+    luaunit.assertEquals(1, #mock.requests, "Should submit a single request")
+    luaunit.assertEquals("read", mock.requests[1].operation, "Should read without a getInfo probe first")
+    luaunit.assertEquals("test_shared/game_state.json", mock.requests[1].filepath, "Should read the game state file")
+    
+    tearDown()
+end
+
+local function TestFileTransportAsyncReadMessageReportsReadErrors()
+    setUp()
+    local mock = setup_mock_love_thread()
+    
+    local transport = FileTransport.new("test_shared")
+    local results = {}
+    local function read_game_state()
+        transport:read_message("game_state", function(success, data)
+            table.insert(results, {success = success, data = data})
+        end)
+        return mock.requests[#mock.requests].id
+    end
+    
+    -- The worker passes love.filesystem.read's failure message through as the error
+    local missing_id = read_game_state()
+    table.insert(mock.responses, {id = missing_id, operation = "read", success = true, data = nil,
+        error = "Could not open file test_shared/game_state.json. Does not exist."})
+    local unreadable_id = read_game_state()
+    table.insert(mock.responses, {id = unreadable_id, operation = "read", success = true, data = nil,
+        error = "Could not read file test_shared/game_state.json. Permission denied."})
+    transport:update()
+    
+    luaunit.assertEquals(2, #results, "Should complete both reads")
+    luaunit.assertTrue(results[1].success, "Should treat a missing file as no message")
+    luaunit.assertNil(results[1].data, "Should return no data for a missing file")
+    luaunit.assertFalse(results[2].success, "Should report read errors as failures")
+    luaunit.assertNotNil(string.find(love.filesystem.files["test_shared/file_transport_debug.log"], "Permission denied", 1, true), "Should log the read error")
     
     tearDown()
 end
@@ -666,34 +818,10 @@ local function TestFileTransportAsyncUpdate()
     setUp()
     
     -- Mock async environment with responses
-    local responses = {
+    setup_mock_love_thread({
         {id = 1, operation = "write", success = true, data = true},
         {id = 2, operation = "read", success = true, data = '{"test": "content"}'}
-    }
-    local response_index = 1
-    
-    local mock_thread = {
-        start = function() end,
-        isRunning = function() return true end
-    }
-    
-    love.thread = {
-        newThread = function(code) return mock_thread end,
-        getChannel = function(name) 
-            return {
-                push = function(data) end,
-                pop = function() 
-                    if response_index <= #responses then
-                        local response = responses[response_index]
-                        response_index = response_index + 1
-                        return response
-                    end
-                    return nil
-                end,
-                demand = function() return nil end
-            }
-        end
-    }
+    })
     
     local transport = FileTransport.new("test_shared")
     
@@ -723,29 +851,14 @@ end
 local function TestFileTransportAsyncCleanup()
     setUp()
     
-    -- Mock async environment BEFORE transport initialization
-    local exit_sent = false
-    local mock_thread = {
-        start = function() end,
-        isRunning = function() return not exit_sent end
-    }
-    
-    if not love then love = {} end
-    love.thread = {
-        newThread = function(code) return mock_thread end,
-        getChannel = function(name) 
-            return {
-                push = function(data) 
-                    -- Mock push operation - no actual processing needed for cleanup test
-                end,
-                pop = function() return nil end,
-                demand = function() return nil end
-            }
-        end
-    }
+    -- Mock async environment BEFORE transport initialization; the mock worker stops
+    -- as soon as it is asked to exit, so cleanup doesn't spin until its 5 second timeout
+    local mock = setup_mock_love_thread()
     
+    local now = 0
     love.timer = {
-        sleep = function(duration) end
+        getTime = function() return now end,
+        sleep = function(duration) now = now + duration end
     }
     
     local transport = FileTransport.new("test_shared")
@@ -753,6 +866,8 @@ local function TestFileTransportAsyncCleanup()
     
     transport:cleanup()
     
+    luaunit.assertTrue(mock.exit_requested, "Should send exit request to worker thread")
+    
     -- Note: Due to mock channel complexity, we verify cleanup by checking state changes
     luaunit.assertFalse(transport.async_enabled, "Should disable async after cleanup")
     luaunit.assertNil(transport.worker_thread, "Should clear worker thread reference")
@@ -760,6 +875,58 @@ local function TestFileTransportAsyncCleanup()
     tearDown()
 end
 
+local function TestFileTransportAsyncCleanupTimesOutInWallTime()
+    setUp()
+    setup_mock_love_thread()
+    
+    -- Fake wall clock that only advances while cleanup sleeps
+    local now = 0
+    love.timer = {
+        getTime = function() return now end,
+        sleep = function(duration) now = now + duration end
+    }
+    
+    local transport = FileTransport.new("test_shared")
+    transport.worker_thread = {isRunning = function() return true end}
+    
+    transport:cleanup()
+    
+    luaunit.assertTrue(now >= 5, "Should wait the full timeout for a stuck worker")
+    luaunit.assertTrue(now < 5.1, "Should stop waiting once the timeout has passed")
+    luaunit.assertNil(transport.worker_thread, "Should clear worker thread reference")
+    
+    tearDown()
+end
+
+local function TestFileTransportAsyncCleanupListsDirectoryOnce()
+    setUp()
+    local mock = setup_mock_love_thread()
+    
+    local transport = FileTransport.new("test_shared")
+    local callback_success = nil
+    local callback_count = nil
+    
+    local initiated = transport:cleanup_old_messages(300, function(success, count)
+        callback_success = success
+        callback_count = count
+    end)
+    
+    luaunit.assertTrue(initiated, "Should initiate async cleanup")
+    luaunit.assertEquals(1, #mock.requests, "Should submit a single request")
+    luaunit.assertEquals("getDirectoryItems", mock.requests[1].operation, "Should list the directory first")
+    luaunit.assertEquals("test_shared", mock.requests[1].filepath, "Should list the shared directory")
+    
+    -- Directory holds no managed files, so cleanup finishes without any getInfo
+    table.insert(mock.responses, {id = mock.requests[1].id, operation = "getDirectoryItems", success = true, data = {"notes.txt"}})
+    transport:update()
+    
+    luaunit.assertTrue(callback_success, "Should complete cleanup when no managed files are present")
+    luaunit.assertEquals(0, callback_count, "Should report no files removed")
+    luaunit.assertEquals(1, #mock.requests, "Should not stat files that aren't present")
+    
+    tearDown()
+end
+
 -- Helper function to count pending requests
 function FileTransport:count_pending_requests()
     local count = 0
@@ -785,6 +952,8 @@ return {
     TestFileTransportWriteMessageErrorHandling = TestFileTransportWriteMessageErrorHandling,
     TestFileTransportReadMessage = TestFileTransportReadMessage,
     TestFileTransportReadMessageFileNotFound = TestFileTransportReadMessageFileNotFound,
+    TestFileTransportReadMessageSkipsExistenceCheck = TestFileTransportReadMessageSkipsExistenceCheck,
+    TestFileTransportReadMessageReportsReadErrors = TestFileTransportReadMessageReportsReadErrors,
     TestFileTransportReadActionsWithSequenceTracking = TestFileTransportReadActionsWithSequenceTracking,
     TestFileTransportReadActionsSequenceDeduplication = TestFileTransportReadActionsSequenceDeduplication,
     TestFileTransportReadMessageErrorHandling = TestFileTransportReadMessageErrorHandling,
@@ -793,15 +962,21 @@ return {
     TestFileTransportVerifyMessageFileMissing = TestFileTransportVerifyMessageFileMissing,
     TestFileTransportVerifyMessageSequenceIDMismatch = TestFileTransportVerifyMessageSequenceIDMismatch,
     TestFileTransportCleanupOldMessages = TestFileTransportCleanupOldMessages,
+    TestFileTransportCleanupOnlyChecksPresentFiles = TestFileTransportCleanupOnlyChecksPresentFiles,
     TestFileTransportCleanupWithCurrentDirectory = TestFileTransportCleanupWithCurrentDirectory,
     TestFileTransportCleanupErrorHandling = TestFileTransportCleanupErrorHandling,
     TestFileTransportDiagnoseWriteFailure = TestFileTransportDiagnoseWriteFailure,
     TestFileTransportLogging = TestFileTransportLogging,
+    TestFileTransportLoggingAppendsWithoutRereading = TestFileTransportLoggingAppendsWithoutRereading,
+    TestFileTransportLoggingReusesTimestampWithinSecond = TestFileTransportLoggingReusesTimestampWithinSecond,
     TestFileTransportLoggingWithCurrentDirectory = TestFileTransportLoggingWithCurrentDirectory,
     TestFileTransportAsyncInitialization = TestFileTransportAsyncInitialization,
     TestFileTransportAsyncFallback = TestFileTransportAsyncFallback,
     TestFileTransportAsyncWriteMessage = TestFileTransportAsyncWriteMessage,
     TestFileTransportAsyncReadMessage = TestFileTransportAsyncReadMessage,
+    TestFileTransportAsyncReadMessageReportsReadErrors = TestFileTransportAsyncReadMessageReportsReadErrors,
     TestFileTransportAsyncUpdate = TestFileTransportAsyncUpdate,
-    TestFileTransportAsyncCleanup = TestFileTransportAsyncCleanup
+    TestFileTransportAsyncCleanup = TestFileTransportAsyncCleanup,
+    TestFileTransportAsyncCleanupTimesOutInWallTime = TestFileTransportAsyncCleanupTimesOutInWallTime,
+    TestFileTransportAsyncCleanupListsDirectoryOnce = TestFileTransportAsyncCleanupListsDirectoryOnce
 }
\ No newline at end of file
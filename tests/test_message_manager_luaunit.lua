@@ -173,6 +173,38 @@ local function TestMessageManagerCreateMessageStructure()
     tearDown()
 end
 
+local function TestMessageManagerCreateMessageReusesTimestampWithinSecond()
+    setUp()
+    
+    local transport = MockTransport.new()
+    local manager = MessageManager.new(transport, "TEST_MANAGER")
+    
+    local original_time = os.time
+    local original_date = os.date
+    local date_calls = 0
+    os.time = function() return 1700000000 end
+    os.date = function(format, time)
+        date_calls = date_calls + 1
+        return original_date(format, time)
+    end
+    
+    local success, result = pcall(function()
+        local message1 = manager:create_message({}, "test_type")
+        local message2 = manager:create_message({}, "test_type")
+        return {message1, message2}
+    end)
+    
+    os.time = original_time
+    os.date = original_date
+    
+    luaunit.assertTrue(success, "Should create messages: " .. tostring(result))
+    luaunit.assertEquals("2023-11-14T22:13:20Z", result[1].timestamp, "Should format the current time")
+    luaunit.assertEquals(result[1].timestamp, result[2].timestamp, "Should reuse timestamp within the same second")
+    luaunit.assertEquals(1, date_calls, "Should format the timestamp only once per second")
+    
+    tearDown()
+end
+
 local function TestMessageManagerCreateMessageErrorHandling()
     setUp()
     
@@ -577,6 +609,7 @@ return {
     TestMessageManagerSMODSLoadingFailure = TestMessageManagerSMODSLoadingFailure,
     TestMessageManagerSequenceIDIncrement = TestMessageManagerSequenceIDIncrement,
     TestMessageManagerCreateMessageStructure = TestMessageManagerCreateMessageStructure,
+    TestMessageManagerCreateMessageReusesTimestampWithinSecond = TestMessageManagerCreateMessageReusesTimestampWithinSecond,
     TestMessageManagerCreateMessageErrorHandling = TestMessageManagerCreateMessageErrorHandling,
     TestMessageManagerWriteGameState = TestMessageManagerWriteGameState,
     TestMessageManagerWriteDeckState = TestMessageManagerWriteDeckState,
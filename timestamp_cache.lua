@@ -0,0 +1,25 @@
+-- Timestamp Cache - Formats the current time at most once per second
+-- Messages and log lines are produced in bursts within the same second, so the
+-- formatted string is reused until os.time() moves on
+
+local TimestampCache = {}
+TimestampCache.__index = TimestampCache
+
+function TimestampCache.new(format)
+    local self = setmetatable({}, TimestampCache)
+    self.format = format
+    self.time = nil
+    self.value = nil
+    return self
+end
+
+function TimestampCache:get()
+    local now = os.time()
+    if now ~= self.time then
+        self.time = now
+        self.value = os.date(self.format, now)
+    end
+    return self.value
+end
+
+return TimestampCache
@@ -2,6 +2,14 @@
 -- Handles all file system operations, path management, and file verification
 -- Follows Single Responsibility Principle - focused solely on file I/O operations
 
+-- Shared per-second timestamp formatting; plain require covers test environments without SMODS
+local TimestampCache
+if SMODS and SMODS.load_file then
+    TimestampCache = assert(SMODS.load_file("timestamp_cache.lua"))()
+else
+    TimestampCache = require("timestamp_cache")
+end
+
 local FileTransport = {}
 FileTransport.__index = FileTransport
 
@@ -28,7 +36,7 @@ while true do
         error = nil
     }
     
-    local ok, result = pcall(function()
+    local ok, result, detail = pcall(function()
         if request.operation == 'read' then
             return love.filesystem.read(request.filepath)
         elseif request.operation == 'write' then
@@ -39,6 +47,8 @@ while true do
             return love.filesystem.getInfo(request.filepath)
         elseif request.operation == 'createDirectory' then
             return love.filesystem.createDirectory(request.filepath)
+        elseif request.operation == 'getDirectoryItems' then
+            return love.filesystem.getDirectoryItems(request.filepath)
         else
             error("Unknown operation: " .. tostring(request.operation))
         end
@@ -47,6 +57,11 @@ while true do
     if ok then
         response.success = true
         response.data = result
+        -- love.filesystem reports failures as nil plus a message (e.g. a read that
+        -- couldn't open the file); pass the message on so the caller can tell why
+        if result == nil and detail ~= nil then
+            response.error = tostring(detail)
+        end
     else
         response.success = false
         response.error = tostring(result)
@@ -56,12 +71,21 @@ while true do
 end
 ]]
 
+-- Message files that cleanup_old_messages is allowed to remove
+local MANAGED_FILES = {"game_state.json", "deck_state.json", "remaining_deck.json", "full_deck.json", "hand_levels.json", "actions.json", "action_results.json"}
+
 function FileTransport.new(base_path)
     local self = setmetatable({}, FileTransport)
     -- Use relative path within mod directory (Love2D filesystem sandbox)
     self.base_path = base_path or "shared"
+    self.filepaths = {}
+    self.managed_filepaths = {}
+    for _, filename in ipairs(MANAGED_FILES) do
+        self.managed_filepaths[filename] = self.base_path == "." and filename or (self.base_path .. "/" .. filename)
+    end
     self.last_read_sequences = {}
     self.component_name = "FILE_TRANSPORT"
+    self.log_timestamp_cache = TimestampCache.new("%Y-%m-%d %H:%M:%S")
     self.write_success_count = 0
     
     -- Async operation tracking
@@ -104,14 +128,11 @@ function FileTransport:log(message)
     if love and love.filesystem and self.base_path then
         local success, err = pcall(function()
             local log_file = self:get_filepath("debug.log")
-            local timestamp = os.date("%Y-%m-%d %H:%M:%S")
+            local timestamp = self.log_timestamp_cache:get()
             local log_entry = "[" .. timestamp .. "] " .. message .. "\n"
             
-            local existing_content = ""
-            if love.filesystem.getInfo(log_file) then
-                existing_content = love.filesystem.read(log_file) or ""
-            end
-            love.filesystem.write(log_file, existing_content .. log_entry)
+            -- Append rather than read and rewrite the whole log on every line
+            love.filesystem.append(log_file, log_entry)
         end)
         
         if not success then
@@ -170,27 +191,37 @@ function FileTransport:initialize_async()
     self:log("Async file operations initialized")
 end
 
+-- Shared file name for each message type; built once rather than on every path lookup
+local FILENAME_MAP = {
+    game_state = "game_state.json",
+    deck_state = "deck_state.json",
+    remaining_deck = "remaining_deck.json",
+    full_deck = "full_deck.json",
+    hand_levels = "hand_levels.json",
+    vouchers_ante = "vouchers_ante.json",
+    actions = "actions.json",
+    action_result = "action_results.json",
+    ["debug.log"] = "file_transport_debug.log"
+}
+
 -- Private method - constructs file path based on message type
 function FileTransport:get_filepath(message_type)
-    local filename_map = {
-        game_state = "game_state.json",
-        deck_state = "deck_state.json",
-        remaining_deck = "remaining_deck.json",
-        full_deck = "full_deck.json",
-        hand_levels = "hand_levels.json",
-        vouchers_ante = "vouchers_ante.json",
-        actions = "actions.json",
-        action_result = "action_results.json",
-        ["debug.log"] = "file_transport_debug.log"
-    }
+    -- Paths are looked up on every poll, so each one is built once per transport
+    local filepath = self.filepaths[message_type]
+    if filepath then
+        return filepath
+    end
     
-    local filename = filename_map[message_type] or (message_type .. ".json")
+    local filename = FILENAME_MAP[message_type] or (message_type .. ".json")
     
     if self.base_path == "." then
-        return filename
+        filepath = filename
     else
-        return self.base_path .. "/" .. filename
+        filepath = self.base_path .. "/" .. filename
     end
+    
+    self.filepaths[message_type] = filepath
+    return filepath
 end
 
 -- Async operation helpers
@@ -223,7 +254,7 @@ function FileTransport:submit_async_request(operation, params, callback)
 end
 
 function FileTransport:execute_sync_operation(operation, params, callback)
-    local success, result = pcall(function()
+    local success, result, detail = pcall(function()
         if operation == 'read' then
             return love.filesystem.read(params.filepath)
         elseif operation == 'write' then
@@ -234,13 +265,21 @@ function FileTransport:execute_sync_operation(operation, params, callback)
             return love.filesystem.getInfo(params.filepath)
         elseif operation == 'createDirectory' then
             return love.filesystem.createDirectory(params.filepath)
+        elseif operation == 'getDirectoryItems' then
+            return love.filesystem.getDirectoryItems(params.filepath)
         else
             error("Unknown operation: " .. tostring(operation))
         end
     end)
     
+    -- Match the worker: a nil result carries love.filesystem's failure message
+    local error_message = nil
+    if success and result == nil and detail ~= nil then
+        error_message = tostring(detail)
+    end
+    
     if callback then
-        callback(success, result)
+        callback(success, result, error_message)
     end
     
     return success, result
@@ -296,9 +335,10 @@ function FileTransport:cleanup()
         -- Send exit signal to worker thread
         self.request_channel:push({operation = 'exit'})
         
-        -- Wait for thread to finish (with timeout)
-        local start_time = os.clock()
-        while self.worker_thread:isRunning() and (os.clock() - start_time) < 5 do
+        -- Wait for thread to finish (with timeout). Measured in wall time: os.clock()
+        -- counts CPU time, which barely advances while this loop sleeps
+        local deadline = love.timer.getTime() + 5
+        while self.worker_thread:isRunning() and love.timer.getTime() < deadline do
             love.timer.sleep(0.01)
         end
         
@@ -345,6 +385,12 @@ function FileTransport:write_message(message_data, message_type, callback)
     end
 end
 
+-- love.filesystem.read returns nil plus a message on failure; a missing file
+-- reports "Could not open file ... Does not exist."
+local function is_missing_file_error(err)
+    return err == nil or string.find(string.lower(tostring(err)), "does not exist", 1, true) ~= nil
+end
+
 function FileTransport:read_message(message_type, callback)
     if not self:is_available() then
         self:log("ERROR: Filesystem not available")
@@ -356,86 +402,85 @@ function FileTransport:read_message(message_type, callback)
     
     -- If async is enabled and callback provided, use async
     if self.async_enabled and callback then
-        -- First check if file exists async
-        self:submit_async_request('getInfo', {
+        -- Read the file async; a missing file reads as nil, so no separate existence check
+        self:submit_async_request('read', {
             filepath = filepath
-        }, function(success, info, error)
-            if not success or not info then
-                callback(true, nil) -- File doesn't exist, not an error
+        }, function(read_success, content, read_error)
+            if not read_success then
+                self:log("ERROR: Failed to read " .. message_type .. " file content: " .. tostring(read_error))
+                callback(false, nil)
                 return
             end
             
-            self:log(message_type .. " file exists, attempting to read")
+            if not content then
+                if is_missing_file_error(read_error) then
+                    callback(true, nil) -- File doesn't exist, not an error
+                    return
+                end
+                
+                self:log("ERROR: Failed to read " .. message_type .. " file content: " .. tostring(read_error))
+                callback(false, nil)
+                return
+            end
+            
+            self:log(message_type .. " file read successfully, size: " .. string.len(content or ""))
             
-            -- Read the file async
-            self:submit_async_request('read', {
-                filepath = filepath
-            }, function(read_success, content, read_error)
-                if not read_success then
-                    self:log("ERROR: Failed to read " .. message_type .. " file content: " .. tostring(read_error))
+            -- For actions, handle sequence tracking and file removal
+            if message_type == "actions" then
+                -- Parse to check sequence
+                local decode_success, data = pcall(self.json.decode, content)
+                if not decode_success then
+                    self:log("ERROR: Failed to parse " .. message_type .. " JSON: " .. tostring(data))
                     callback(false, nil)
                     return
                 end
                 
-                self:log(message_type .. " file read successfully, size: " .. string.len(content or ""))
+                -- Check if this is a new message
+                local sequence_id = data.sequence_id or 0
+                local last_read = self.last_read_sequences[message_type] or 0
                 
-                -- For actions, handle sequence tracking and file removal
-                if message_type == "actions" then
-                    -- Parse to check sequence
-                    local decode_success, data = pcall(self.json.decode, content)
-                    if not decode_success then
-                        self:log("ERROR: Failed to parse " .. message_type .. " JSON: " .. tostring(data))
-                        callback(false, nil)
-                        return
-                    end
-                    
-                    -- Check if this is a new message
-                    local sequence_id = data.sequence_id or 0
-                    local last_read = self.last_read_sequences[message_type] or 0
-                    
-                    self:log(message_type .. " sequence_id: " .. sequence_id .. ", last_read: " .. last_read)
-                    
-                    if sequence_id <= last_read then
-                        self:log(message_type .. " already processed, ignoring")
-                        callback(true, nil) -- Already processed
-                        return
-                    end
-                    
-                    self.last_read_sequences[message_type] = sequence_id
-                    self:log("Processing new " .. message_type .. " with sequence_id: " .. sequence_id)
-                    
-                    -- Remove the file after reading async
-                    self:submit_async_request('remove', {
-                        filepath = filepath
-                    }, function(remove_success, _, remove_error)
-                        if remove_success then
-                            self:log(message_type .. " file removed successfully")
-                        else
-                            self:log("WARNING: Failed to remove " .. message_type .. " file: " .. tostring(remove_error))
-                        end
-                    end)
+                self:log(message_type .. " sequence_id: " .. sequence_id .. ", last_read: " .. last_read)
+                
+                if sequence_id <= last_read then
+                    self:log(message_type .. " already processed, ignoring")
+                    callback(true, nil) -- Already processed
+                    return
                 end
                 
-                callback(true, content)
-            end)
+                self.last_read_sequences[message_type] = sequence_id
+                self:log("Processing new " .. message_type .. " with sequence_id: " .. sequence_id)
+                
+                -- Remove the file after reading async
+                self:submit_async_request('remove', {
+                    filepath = filepath
+                }, function(remove_success, _, remove_error)
+                    if remove_success then
+                        self:log(message_type .. " file removed successfully")
+                    else
+                        self:log("WARNING: Failed to remove " .. message_type .. " file: " .. tostring(remove_error))
+                    end
+                end)
+            end
+            
+            callback(true, content)
         end)
         
         return nil -- Async operation initiated
     else
-        -- Synchronous fallback
-        if not love.filesystem.getInfo(filepath) then
-            if callback then callback(true, nil) end
-            return nil
-        end
-        
-        self:log(message_type .. " file exists, attempting to read")
-        
-        local content, size = love.filesystem.read(filepath)
+        -- Synchronous fallback; reading a missing file just returns nil, so the
+        -- read doubles as the existence check
+        local content, size_or_error = love.filesystem.read(filepath)
         if not content then
-            self:log("ERROR: Failed to read " .. message_type .. " file content")
+            if is_missing_file_error(size_or_error) then
+                if callback then callback(true, nil) end
+                return nil
+            end
+            
+            self:log("ERROR: Failed to read " .. message_type .. " file content: " .. tostring(size_or_error))
             if callback then callback(false, nil) end
             return nil
         end
+        local size = size_or_error
         
         self:log(message_type .. " file read successfully, size: " .. (size or 0))
         
@@ -573,6 +618,22 @@ function FileTransport:verify_message(message_data, message_type, callback)
     end
 end
 
+-- Managed files present in a directory listing, in MANAGED_FILES order
+local function select_managed_files(items)
+    local present = {}
+    for _, name in ipairs(items or {}) do
+        present[name] = true
+    end
+    
+    local files = {}
+    for _, filename in ipairs(MANAGED_FILES) do
+        if present[filename] then
+            files[#files + 1] = filename
+        end
+    end
+    return files
+end
+
 function FileTransport:cleanup_old_messages(max_age_seconds, callback)
     if not self:is_available() then
         self:log("ERROR: Filesystem not available for cleanup")
@@ -582,56 +643,78 @@ function FileTransport:cleanup_old_messages(max_age_seconds, callback)
     
     max_age_seconds = max_age_seconds or 300 -- 5 minutes default
     
-    local files = {"game_state.json", "deck_state.json", "remaining_deck.json", "full_deck.json", "hand_levels.json", "actions.json", "action_results.json"}
     local current_time = os.time()
     local cleanup_count = 0
-    local files_to_check = #files
-    local checked_count = 0
+    -- love.filesystem addresses the save directory root as "", not "."
+    local directory = self.base_path == "." and "" or self.base_path
     
     -- If async is enabled and callback provided, use async
     if self.async_enabled and callback then
-        local function check_complete()
-            checked_count = checked_count + 1
-            if checked_count >= files_to_check then
-                self:log("Async cleanup completed: " .. cleanup_count .. " files removed")
-                callback(true, cleanup_count)
+        -- List the directory once so only managed files that exist get stat'ed
+        self:submit_async_request('getDirectoryItems', {
+            filepath = directory
+        }, function(list_success, items, list_error)
+            if not list_success then
+                self:log("ERROR: Failed to list " .. directory .. " for cleanup: " .. tostring(list_error))
+                callback(false)
+                return
+            end
+            
+            local files = select_managed_files(items)
+            local files_to_check = #files
+            local checked_count = 0
+            
+            local function check_complete()
+                checked_count = checked_count + 1
+                if checked_count >= files_to_check then
+                    self:log("Async cleanup completed: " .. cleanup_count .. " files removed")
+                    callback(true, cleanup_count)
+                end
             end
-        end
-        
-        for _, filename in ipairs(files) do
-            local filepath = self:get_filepath(filename:gsub("%.json$", ""))
             
-            self:submit_async_request('getInfo', {
-                filepath = filepath
-            }, function(success, info, error)
-                if success and info and info.modtime then
-                    local age = current_time - info.modtime
-                    if age > max_age_seconds then
-                        self:submit_async_request('remove', {
-                            filepath = filepath
-                        }, function(remove_success, _, remove_error)
-                            if remove_success then
-                                self:log("Cleaned up old file: " .. filename)
-                                cleanup_count = cleanup_count + 1
-                            else
-                                self:log("WARNING: Failed to remove old file: " .. filename .. " - " .. tostring(remove_error))
-                            end
+            if files_to_check == 0 then
+                self:log("Async cleanup completed: 0 files removed")
+                callback(true, 0)
+                return
+            end
+            
+            for _, filename in ipairs(files) do
+                local filepath = self.managed_filepaths[filename]
+                
+                self:submit_async_request('getInfo', {
+                    filepath = filepath
+                }, function(success, info, error)
+                    if success and info and info.modtime then
+                        local age = current_time - info.modtime
+                        if age > max_age_seconds then
+                            self:submit_async_request('remove', {
+                                filepath = filepath
+                            }, function(remove_success, _, remove_error)
+                                if remove_success then
+                                    self:log("Cleaned up old file: " .. filename)
+                                    cleanup_count = cleanup_count + 1
+                                else
+                                    self:log("WARNING: Failed to remove old file: " .. filename .. " - " .. tostring(remove_error))
+                                end
+                                check_complete()
+                            end)
+                        else
                             check_complete()
-                        end)
+                        end
                     else
                         check_complete()
                     end
-                else
-                    check_complete()
-                end
-            end)
-        end
+                end)
+            end
+        end)
         
         return true -- Async operation initiated
     else
-        -- Synchronous fallback
+        -- Synchronous fallback; list the directory once so only managed files that exist get stat'ed
+        local files = select_managed_files(love.filesystem.getDirectoryItems(directory))
+        
         for _, filename in ipairs(files) do
-            local filepath = self:get_filepath(filename:gsub("%.json$", ""))
+            local filepath = self.managed_filepaths[filename]
             local info = love.filesystem.getInfo(filepath)
             
             if info and info.modtime then
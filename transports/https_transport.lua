@@ -75,12 +75,7 @@ function HttpsTransport:log(message)
             local log_file = "shared/https_transport_debug.log"
             local timestamp = os.date("%Y-%m-%d %H:%M:%S")
             local log_entry = "[" .. timestamp .. "] " .. message .. "\n"
-            
-            local existing_content = ""
-            if love.filesystem.getInfo(log_file) then
-                existing_content = love.filesystem.read(log_file) or ""
-            end
-            love.filesystem.write(log_file, existing_content .. log_entry)
+            love.filesystem.append(log_file, log_entry)
         end)
         
         if not success then